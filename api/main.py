@@ -6,12 +6,20 @@ et définit les routes principales de l'API.
 """
 
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from .routes import router
+from fastapi.responses import JSONResponse, ORJSONResponse
+from .routes import router, user_repository
+import importlib.util
 import logging
+import os
 from typing import Dict, Optional, Type, List, Any
 
+# ORJSONResponse needs orjson at render time; fall back to the stdlib encoder
+_DefaultResponse: Type[JSONResponse] = (
+    ORJSONResponse if importlib.util.find_spec("orjson") is not None else JSONResponse
+)
+
 class APIConfig:
     """Configuration pour l'API et la documentation Swagger/OpenAPI.
     
@@ -20,6 +28,8 @@ class APIConfig:
         DESCRIPTION (str): Description de l'API
         VERSION (str): Version actuelle de l'API
         TAGS_METADATA (List[Dict[str, str]]): Métadonnées pour la documentation OpenAPI
+        ENABLE_DOCS (bool): Expose Swagger et le schéma OpenAPI (ENABLE_DOCS=0 pour les désactiver)
+        LOG_LEVEL (str): Niveau de log de l'application (INFO par défaut)
     """
     TITLE: str = "GitHub Users API"
     DESCRIPTION: str = "API for accessing filtered GitHub user data"
@@ -34,9 +44,11 @@ class APIConfig:
             "description": "API health check"
         }
     ]
+    ENABLE_DOCS: bool = os.getenv("ENABLE_DOCS", "1") == "1"
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
 
 # Configure logging
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=APIConfig.LOG_LEVEL)
 logger: logging.Logger = logging.getLogger(__name__)
 
 # Create FastAPI instance with simplified OpenAPI config
@@ -44,8 +56,10 @@ app: FastAPI = FastAPI(
     title=APIConfig.TITLE,
     description=APIConfig.DESCRIPTION,
     version=APIConfig.VERSION,
-    openapi_url="/api/v1/openapi.json",
-    docs_url="/docs"
+    openapi_url="/api/v1/openapi.json" if APIConfig.ENABLE_DOCS else None,
+    docs_url="/docs" if APIConfig.ENABLE_DOCS else None,
+    redoc_url="/redoc" if APIConfig.ENABLE_DOCS else None,
+    default_response_class=_DefaultResponse
 )
 
 # Configure CORS
@@ -64,6 +78,26 @@ app.include_router(
     tags=["users"]
 )
 
+@app.on_event("startup")
+async def preload_users() -> None:
+    """Charge les données utilisateurs en cache avant de servir les requêtes.
+    
+    Un fichier absent ou invalide n'empêche pas le démarrage : l'API sert
+    alors une liste vide jusqu'au prochain rechargement réussi.
+    """
+    try:
+        users = await run_in_threadpool(user_repository.load_all)
+    except (IOError, ValueError):
+        logger.warning("Starting without user data; call POST /users/reload once the file is fixed")
+        return
+    logger.info("Preloaded %d users", len(users))
+
+@app.on_event("startup")
+async def build_openapi_schema() -> None:
+    """Construit le schéma OpenAPI au démarrage plutôt qu'au premier appel de /docs."""
+    if APIConfig.ENABLE_DOCS:
+        app.openapi_schema = app.openapi()
+
 @app.get("/", tags=["health"])
 async def root() -> Dict[str, str]:
     """
@@ -8,6 +8,10 @@ pour la validation et la sérialisation des données utilisateur GitHub.
 from datetime import datetime
 from pydantic import BaseModel, HttpUrl, Field, validator
 from typing import Optional, Dict, Any, ClassVar, Type, Union
+import sys
+
+# datetime.fromisoformat accepts the "Z" suffix natively since Python 3.11
+_PY311 = sys.version_info >= (3, 11)
 
 class UserConfig:
     """Classe de configuration pour les valeurs par défaut et contraintes du modèle User.
@@ -90,6 +94,8 @@ class User(BaseModel):
             datetime: Date parsée avec fuseau horaire
         """
         if isinstance(value, str):
+            if _PY311:
+                return datetime.fromisoformat(value)
             return datetime.fromisoformat(value.replace('Z', '+00:00'))
         return value
 
@@ -6,90 +6,209 @@ et la logique métier pour l'accès aux utilisateurs GitHub.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from typing import List, Dict, Any, Optional
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
+from bisect import bisect_right
+from functools import lru_cache
 import json
 import logging
+import os
+import threading
 from datetime import datetime, timezone
-from .models import User
+from pydantic import HttpUrl, ValidationError, parse_obj_as
+from .models import User, _PY311
 from .security import get_current_user
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode()
+
 class RouterConfig:
     """Configuration pour les endpoints du router.
     
     Attributes:
         SEARCH_MIN_LENGTH (int): Longueur minimale pour les termes de recherche
         DEFAULT_LIMIT (int): Limite par défaut pour les résultats paginés
+        SEARCH_SEPARATOR (str): Séparateur des champs dans l'index de recherche
+        SEARCH_CACHE_SIZE (int): Nombre de recherches gardées en cache
+        VALIDATE_RESPONSES (bool): Valide les réponses avec Pydantic (VALIDATE_RESPONSES=1).
+            Désactivé par défaut, les données sur disque étant déjà filtrées.
     """
     SEARCH_MIN_LENGTH: int = 3
     DEFAULT_LIMIT: int = 10
+    SEARCH_SEPARATOR: str = "\0"
+    SEARCH_CACHE_SIZE: int = 1024
+    VALIDATE_RESPONSES: bool = os.getenv("VALIDATE_RESPONSES", "0") == "1"
 
 class UserRepository:
     """Repository pour la gestion des données utilisateur.
     
     Cette classe gère le chargement, la transformation et la recherche
-    des données utilisateur stockées au format JSON.
+    des données utilisateur stockées au format JSON Lines. Les données parsées
+    sont chargées au démarrage puis rechargées uniquement par reload() ;
+    les méthodes de lecture servent l'instantané en mémoire sans accéder
+    au disque.
     
     Attributes:
-        filepath (Path): Chemin vers le fichier JSON des utilisateurs
+        filepath (Path): Chemin vers le fichier JSON Lines des utilisateurs
     """
     
     def __init__(self) -> None:
         """Initialise le repository avec le chemin du fichier de données."""
-        self.filepath: Path = Path("data/filtered_users.json")
+        self.filepath: Path = Path("data/filtered_users.jsonl")
+        self._cache: Optional[List[Dict[str, Any]]] = None
+        self._by_login: Dict[str, Dict[str, Any]] = {}
+        self._users_json: bytes = b"[]"
+        self._search_index: Tuple[str, List[int], List[Dict[str, Any]]] = ("", [], [])
+        self._version: int = 0
+        self._search_cached = lru_cache(maxsize=RouterConfig.SEARCH_CACHE_SIZE)(self._search_uncached)
+        self._mtime: int = -1
+        self._lock: threading.Lock = threading.Lock()
 
-    def _transform_dates(self, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Transforme les dates string en objets datetime.
+    def _normalize(self, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Normalise les utilisateurs une seule fois, au remplissage du cache.
+        
+        Les dates sont converties en chaînes ISO 8601 (UTC) et les URLs
+        d'avatar validées, afin que les réponses soient prêtes à être
+        sérialisées sans conversion à chaque requête.
         
         Args:
             users: Liste des utilisateurs avec dates au format string
             
         Returns:
-            Liste des utilisateurs avec dates au format datetime
+            Liste des utilisateurs normalisés, sans ceux dont l'avatar est invalide
         """
+        normalized: List[Dict[str, Any]] = []
         for user in users:
             created_at = user['created_at']
             if isinstance(created_at, str):
-                if created_at.endswith('Z'):
+                if not _PY311 and created_at.endswith('Z'):
                     created_at = created_at[:-1]
                 dt = datetime.fromisoformat(created_at)
-                user['created_at'] = dt.replace(tzinfo=timezone.utc)
-        return users
+                user['created_at'] = dt.replace(tzinfo=timezone.utc).isoformat()
+            try:
+                user['avatar_url'] = str(parse_obj_as(HttpUrl, user['avatar_url']))
+            except ValidationError as e:
+                logger.warning("Skipping user %s: invalid avatar_url (%s)", user.get('login'), e)
+                continue
+            normalized.append(user)
+        return normalized
+
+    def _build_search_index(self, users: List[Dict[str, Any]]) -> Tuple[str, List[int]]:
+        """Construit l'index de recherche en minuscules.
+        
+        Les logins et bios de tous les utilisateurs sont concaténés dans une
+        seule chaîne, chaque champ étant suivi de RouterConfig.SEARCH_SEPARATOR.
+        
+        Args:
+            users: Liste des utilisateurs normalisés
+            
+        Returns:
+            Tuple contenant la chaîne concaténée et la position de début
+            de chaque utilisateur dans cette chaîne
+        """
+        sep = RouterConfig.SEARCH_SEPARATOR
+        parts: List[str] = []
+        offsets: List[int] = []
+        position = 0
+        for user in users:
+            entry = f"{user.get('login', '').lower()}{sep}{(user.get('bio') or '').lower()}{sep}"
+            offsets.append(position)
+            parts.append(entry)
+            position += len(entry)
+        return "".join(parts), offsets
 
     def load_all(self) -> List[Dict[str, Any]]:
-        """Charge tous les utilisateurs depuis le fichier JSON.
+        """Charge tous les utilisateurs depuis le cache ou le fichier JSON Lines.
+        
+        Le fichier contient un utilisateur JSON par ligne et n'est relu que
+        si sa date de modification a changé depuis le dernier chargement.
+        Cette méthode accède au disque : elle est appelée au démarrage et
+        par reload(), depuis le pool de threads, jamais depuis une route.
+        
+        En cas d'erreur, les données déjà chargées sont conservées et
+        continuent d'être servies.
         
         Returns:
-            Liste de tous les utilisateurs avec dates transformées
+            Liste de tous les utilisateurs normalisés
             
         Raises:
             IOError: Si le fichier ne peut pas être lu
-            json.JSONDecodeError: Si le JSON est invalide
+            ValueError: Si le JSON ou une date est invalide
         """
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                users = json.load(f)
-                return self._transform_dates(users)
-        except (IOError, json.JSONDecodeError) as e:
-            logger.error(f"Error loading users: {e}")
-            return []
+            with self._lock:
+                mtime = self.filepath.stat().st_mtime_ns
+                if self._cache is not None and mtime == self._mtime:
+                    return self._cache
+                with open(self.filepath, 'rb') as f:
+                    users = [_loads(line) for line in f if line.strip()]
+                users = self._normalize(users)
+                by_login = {user["login"]: user for user in reversed(users)}
+                users_json = b"[" + b",".join(_dumps(user) for user in users) + b"]"
+                search_index = (*self._build_search_index(users), users)
+                # Swap the snapshot only once the whole file has been processed
+                self._by_login = by_login
+                self._users_json = users_json
+                self._search_index = search_index
+                self._invalidate_search()
+                self._cache = users
+                self._mtime = mtime
+                return self._cache
+        except (IOError, ValueError) as e:
+            logger.error("Error loading users: %s", e)
+            raise
+
+    def _invalidate_search(self) -> None:
+        """Invalide les résultats de recherche mis en cache."""
+        self._version += 1
+        self._search_cached.cache_clear()
+
+    def _search_uncached(self, query_lower: str, version: int) -> Tuple[Dict[str, Any], ...]:
+        """Parcourt l'index de recherche pour un terme déjà en minuscules.
+        
+        Args:
+            query_lower: Terme de recherche en minuscules
+            version: Version des données, utilisée comme clé du cache
+            
+        Returns:
+            Tuple des utilisateurs correspondant au terme
+        """
+        _ = version
+        if RouterConfig.SEARCH_SEPARATOR in query_lower:
+            return ()
+        haystack, offsets, users = self._search_index
+        matches: List[Dict[str, Any]] = []
+        position = haystack.find(query_lower)
+        while position != -1:
+            index = bisect_right(offsets, position) - 1
+            matches.append(users[index])
+            if index + 1 >= len(offsets):
+                break
+            position = haystack.find(query_lower, offsets[index + 1])
+        return tuple(matches)
 
     def search(self, query: str) -> List[Dict[str, Any]]:
         """Recherche des utilisateurs par terme.
         
+        Les résultats sont mis en cache par terme jusqu'au prochain
+        rechargement des données.
+        
         Args:
             query: Terme de recherche
             
         Returns:
             Liste des utilisateurs correspondant au terme
         """
-        users = self.load_all()
-        query_lower = query.lower()
-        return [
-            user for user in users
-            if query_lower in user.get("login", "").lower() or
-            (user.get("bio") and query_lower in user.get("bio", "").lower())
-        ]
+        return list(self._search_cached(query.lower(), self._version))
 
     def get_user_by_login(self, login: str) -> Optional[Dict[str, Any]]:
         """Récupère un utilisateur par son login.
@@ -100,27 +219,60 @@ class UserRepository:
         Returns:
             Données de l'utilisateur ou None si non trouvé
         """
-        users = self.load_all()
-        return next((user for user in users if user["login"] == login), None)
+        return self._by_login.get(login)
+
+    def get_all(self) -> List[Dict[str, Any]]:
+        """Retourne tous les utilisateurs chargés en mémoire.
+        
+        Returns:
+            Liste de tous les utilisateurs normalisés (vide si aucun chargement
+            n'a abouti)
+        """
+        return self._cache or []
+
+    def get_all_json(self) -> bytes:
+        """Retourne tous les utilisateurs déjà sérialisés en JSON.
+        
+        La sérialisation est faite une seule fois au remplissage du cache.
+        
+        Returns:
+            Tableau JSON de tous les utilisateurs normalisés
+        """
+        return self._users_json
+
+    def reload(self) -> List[Dict[str, Any]]:
+        """Recharge les données si le fichier JSON Lines a changé.
+        
+        Returns:
+            Liste de tous les utilisateurs normalisés
+            
+        Raises:
+            IOError: Si le fichier ne peut pas être lu
+            ValueError: Si le JSON ou une date est invalide
+        """
+        return self.load_all()
 
 # Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-# Create router and repository instances
+# Create router and repository instances.
+# Routes are `async def`: they must never perform blocking I/O themselves.
+# They only read the in-memory snapshot; the file is read at startup
+# (see api/main.py) and by POST /reload, both in the threadpool.
 router = APIRouter()
 user_repository = UserRepository()
 
 @router.get(
     "/",
-    response_model=List[User],
+    response_model=List[User] if RouterConfig.VALIDATE_RESPONSES else None,
+    responses={status.HTTP_200_OK: {"model": List[User]}},
     summary="Récupérer tous les utilisateurs",
     response_description="Liste de tous les utilisateurs GitHub",
     tags=["users"]
 )
 async def get_users(
     current_user: str = Depends(get_current_user)
-) -> List[Dict[str, Any]]:
+) -> Union[List[Dict[str, Any]], Response]:
     """
     ## Description
     Retourne la liste complète des utilisateurs GitHub présents dans la base de données.
@@ -150,11 +302,14 @@ async def get_users(
     - **401 Unauthorized** : Authentification requise ou échouée.
     - **500 Internal Server Error** : Erreur interne du serveur.
     """
-    return user_repository.load_all()
+    if RouterConfig.VALIDATE_RESPONSES:
+        return user_repository.get_all()
+    return Response(content=user_repository.get_all_json(), media_type="application/json")
 
 @router.get(
     "/search",
-    response_model=List[User],
+    response_model=List[User] if RouterConfig.VALIDATE_RESPONSES else None,
+    responses={status.HTTP_200_OK: {"model": List[User]}},
     summary="Rechercher des utilisateurs",
     response_description="Liste des utilisateurs correspondant à la recherche",
     tags=["users"]
@@ -193,13 +348,13 @@ async def search_users(
     - **500 Internal Server Error** : Erreur interne du serveur.
     """
     _ = current_user
-    logger.debug(f"Starting search with query: '{q}'")
+    logger.debug("Starting search with query: '%s'", q)
     try:
         matches = user_repository.search(q)
-        logger.info(f"Found {len(matches)} matches for query: '{q}'")
+        logger.info("Found %d matches for query: '%s'", len(matches), q)
         return matches
     except Exception as e:
-        logger.error(f"Search error: {e}", exc_info=True)
+        logger.error("Search error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
@@ -207,7 +362,8 @@ async def search_users(
 
 @router.get(
     "/{login}",
-    response_model=User,
+    response_model=User if RouterConfig.VALIDATE_RESPONSES else None,
+    responses={status.HTTP_200_OK: {"model": User}},
     summary="Récupérer un utilisateur par login",
     response_description="Détails d'un utilisateur",
     tags=["users"]
@@ -257,4 +413,51 @@ async def get_user_by_login(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User {login} not found"
         )
-    return User(**user)
\ No newline at end of file
+    if RouterConfig.VALIDATE_RESPONSES:
+        return User(**user)
+    return User.construct(**user)
+
+@router.post(
+    "/reload",
+    summary="Recharger les données utilisateurs",
+    response_description="Nombre d'utilisateurs chargés",
+    tags=["users"]
+)
+async def reload_users(
+    current_user: str = Depends(get_current_user)
+) -> Dict[str, int]:
+    """
+    ## Description
+    Recharge le fichier de données utilisateurs depuis le disque, hors de la boucle d'événements,
+    s'il a été modifié depuis le dernier chargement. En cas d'échec, les données déjà chargées
+    continuent d'être servies.
+
+    ## Paramètres
+    - **current_user** (*str*, dépendance) : Utilisateur authentifié (injecté automatiquement).
+
+    ## Exemples
+    **Requête :**
+    ```
+    POST /users/reload
+    ```
+    **Réponse :**
+    ```json
+    {
+        "count": 3000
+    }
+    ```
+
+    ## Codes d'erreur
+    - **401 Unauthorized** : Authentification requise ou échouée.
+    - **500 Internal Server Error** : Fichier de données illisible ou invalide.
+    """
+    _ = current_user
+    try:
+        users = await run_in_threadpool(user_repository.reload)
+    except (IOError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Échec du rechargement des données"
+        )
+    logger.info("Reloaded %d users", len(users))
+    return {"count": len(users)}
\ No newline at end of file
@@ -7,7 +7,7 @@ Il fournit une interface cohérente pour la sécurisation des endpoints de l'API
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from typing import Dict, Optional, Type, ClassVar, NoReturn
+from typing import Optional, Type, ClassVar, NoReturn
 import os
 from dotenv import load_dotenv
 import logging
@@ -46,12 +46,14 @@ class AuthenticationManager:
         )
         
     def _load_environment(self) -> None:
-        """Charge les variables d'environnement pour l'authentification."""
+        """Charge les variables d'environnement pour l'authentification.
+        
+        Les identifiants attendus sont encodés une seule fois, pour être
+        comparés directement aux identifiants reçus à chaque requête.
+        """
         load_dotenv()
-        self.valid_users: Dict[str, str] = {
-            os.getenv("BASIC_AUTH_USER", SecurityConfig.DEFAULT_USER): 
-            os.getenv("BASIC_AUTH_PASS", SecurityConfig.DEFAULT_PASS)
-        }
+        self._username: bytes = os.getenv("BASIC_AUTH_USER", SecurityConfig.DEFAULT_USER).encode()
+        self._password: bytes = os.getenv("BASIC_AUTH_PASS", SecurityConfig.DEFAULT_PASS).encode()
         
     def authenticate(self, credentials: HTTPBasicCredentials) -> str:
         """
@@ -66,30 +68,20 @@ class AuthenticationManager:
         Raises:
             HTTPException: Si l'authentification échoue
         """
-        try:
-            is_valid = secrets.compare_digest(
-                self.valid_users.get(credentials.username, ""),
-                credentials.password
-            )
-            
-            if not is_valid:
-                self.logger.warning(f"Tentative d'authentification échouée pour l'utilisateur: {credentials.username}")
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Identifiants invalides",
-                    headers={"WWW-Authenticate": "Basic"},
-                )
-                
-            self.logger.info(f"Authentification réussie pour l'utilisateur: {credentials.username}")
-            return credentials.username
-            
-        except Exception as e:
-            self.logger.error(f"Erreur d'authentification: {str(e)}")
+        # Both comparisons always run to keep the check constant-time
+        username_ok = secrets.compare_digest(credentials.username.encode(), self._username)
+        password_ok = secrets.compare_digest(credentials.password.encode(), self._password)
+        
+        if not (username_ok and password_ok):
+            self.logger.warning("Tentative d'authentification échouée pour l'utilisateur: %s", credentials.username)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Authentification échouée",
+                detail="Identifiants invalides",
                 headers={"WWW-Authenticate": "Basic"},
             )
+            
+        self.logger.info("Authentification réussie pour l'utilisateur: %s", credentials.username)
+        return credentials.username
 
 # Create singleton instance
 auth_manager = AuthenticationManager()
@@ -8,12 +8,14 @@ et sauvegarder les données des utilisateurs GitHub via leur API REST.
 from typing import Dict, List, Optional, Tuple, ClassVar, Any
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import os
 import logging
 from dotenv import load_dotenv
-from time import sleep
+from time import sleep, monotonic
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 class GitHubConfig:
     """Configuration pour l'interaction avec l'API GitHub.
@@ -27,12 +29,18 @@ class GitHubConfig:
         DEFAULT_MAX_USERS (int): Nombre maximum d'utilisateurs par défaut
         BATCH_SIZE (int): Taille du lot d'utilisateurs à extraire par requête
         RATE_LIMIT_THRESHOLD (int): Seuil de la limite de taux avant pause
+        MAX_CONCURRENCY (int): Nombre maximum de requêtes de détail simultanées
+        GRAPHQL_URL (str): URL de l'API GraphQL de GitHub
+        GRAPHQL_USER_FIELDS (str): Champs GraphQL récupérés pour chaque utilisateur
     """
     BASE_URL: ClassVar[str] = "https://api.github.com/users"
     API_VERSION: ClassVar[str] = "application/vnd.github.v3+json"
     DEFAULT_MAX_USERS: ClassVar[int] = 3000
     BATCH_SIZE: ClassVar[int] = 100
     RATE_LIMIT_THRESHOLD: ClassVar[int] = 10
+    MAX_CONCURRENCY: ClassVar[int] = 20
+    GRAPHQL_URL: ClassVar[str] = "https://api.github.com/graphql"
+    GRAPHQL_USER_FIELDS: ClassVar[str] = "login databaseId createdAt avatarUrl bio"
 
 class GitHubUserExtractor:
     """Extracteur de données utilisateurs GitHub.
@@ -43,6 +51,8 @@ class GitHubUserExtractor:
     Attributes:
         token (str): Token d'authentification GitHub
         headers (Dict[str, str]): En-têtes HTTP pour les requêtes
+        session (requests.Session): Session HTTP réutilisant les connexions
+        use_graphql (bool): Récupère les détails par lots via GraphQL
         logger (logging.Logger): Logger pour la classe
     """
     
@@ -54,6 +64,14 @@ class GitHubUserExtractor:
             "Accept": GitHubConfig.API_VERSION,
             "Authorization": f"token {self.token}"
         }
+        self.session: requests.Session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=GitHubConfig.MAX_CONCURRENCY,
+            pool_maxsize=GitHubConfig.MAX_CONCURRENCY
+        )
+        self.session.mount("https://", adapter)
+        self.use_graphql: bool = True
         self.logger: logging.Logger = logging.getLogger(__name__)
 
     def extract_users(self, max_users: int = GitHubConfig.DEFAULT_MAX_USERS) -> List[Dict[str, Any]]:
@@ -75,10 +93,10 @@ class GitHubUserExtractor:
         
         while len(users) < max_users:
             try:
+                batch_start = monotonic()
                 print(f"Requête API pour {GitHubConfig.BATCH_SIZE} utilisateurs depuis ID {since_id}")
-                response = requests.get(
-                    f"{GitHubConfig.BASE_URL}?since={since_id}&per_page={GitHubConfig.BATCH_SIZE}",
-                    headers=self.headers
+                response = self.session.get(
+                    f"{GitHubConfig.BASE_URL}?since={since_id}&per_page={GitHubConfig.BATCH_SIZE}"
                 )
                 response.raise_for_status()
                 
@@ -92,11 +110,15 @@ class GitHubUserExtractor:
                 if len(users) % GitHubConfig.BATCH_SIZE == 0:
                     print(f"Progression: {len(users)}/{max_users} utilisateurs extraits")
                     
-                self._handle_rate_limiting(response)
-                sleep(1)
+                # REST calls per batch: the list call, plus one per user without GraphQL
+                batch_cost = 1 if self.use_graphql else GitHubConfig.BATCH_SIZE + 1
+                pending_batches = -(-(max_users - len(users)) // GitHubConfig.BATCH_SIZE)
+                self._handle_rate_limiting(
+                    response, pending_batches * batch_cost, monotonic() - batch_start, batch_cost
+                )
                 
             except requests.RequestException as e:
-                self.logger.error(f"Erreur durant l'extraction: {e}")
+                self.logger.error("Erreur durant l'extraction: %s", e)
                 break
         
         print(f"Extraction terminée. {len(users)} utilisateurs extraits.")
@@ -110,6 +132,10 @@ class GitHubUserExtractor:
     ) -> Tuple[List[Dict[str, Any]], int]:
         """Traite un lot d'utilisateurs et récupère leurs détails.
         
+        Les détails sont récupérés en une seule requête GraphQL par lot.
+        En cas d'échec, ils sont récupérés via l'API REST en parallèle, dans
+        la limite de GitHubConfig.MAX_CONCURRENCY requêtes simultanées.
+        
         Args:
             batch: Lot brut d'utilisateurs depuis l'API
             users: Liste actuelle des utilisateurs traités
@@ -119,12 +145,14 @@ class GitHubUserExtractor:
             Tuple contenant la liste mise à jour et le dernier ID
         """
         users_batch: List[Dict[str, Any]] = []
+        logins = [user["login"] for user in batch[:max(max_users - len(users), 0)]]
         
-        for user in batch:
-            if len(users) + len(users_batch) >= max_users:
-                break
-                
-            detailed_user = self.get_single_user(user["login"])
+        detailed_users = self.get_users_details(logins) if self.use_graphql else None
+        if detailed_users is None:
+            with ThreadPoolExecutor(max_workers=GitHubConfig.MAX_CONCURRENCY) as executor:
+                detailed_users = list(executor.map(self.get_single_user, logins))
+        
+        for detailed_user in detailed_users:
             if detailed_user:
                 user_data = {
                     "login": detailed_user["login"],
@@ -138,6 +166,71 @@ class GitHubUserExtractor:
         since_id = batch[-1]["id"] if batch else 0
         return users_batch, since_id
 
+    def get_users_details(self, logins: List[str]) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """Récupère les informations détaillées d'un lot d'utilisateurs via GraphQL.
+        
+        Chaque login fait l'objet d'une sous-requête aliasée dans un seul
+        document GraphQL. Les comptes que GraphQL ne résout pas en tant
+        qu'utilisateurs (organisations, comptes renommés) sont récupérés via
+        l'API REST. En cas d'échec de la requête, GraphQL est désactivé pour
+        le reste de l'extraction.
+        
+        Args:
+            logins: Noms d'utilisateur GitHub
+            
+        Returns:
+            Données détaillées au format de l'API REST (None pour les utilisateurs
+            introuvables), ou None si la requête GraphQL a échoué
+        """
+        if not logins:
+            return []
+        
+        declarations = ", ".join(f"$l{i}: String!" for i in range(len(logins)))
+        selections = " ".join(
+            f"u{i}: user(login: $l{i}) {{ {GitHubConfig.GRAPHQL_USER_FIELDS} }}"
+            for i in range(len(logins))
+        )
+        payload = {
+            "query": f"query({declarations}) {{ {selections} }}",
+            "variables": {f"l{i}": login for i, login in enumerate(logins)}
+        }
+        
+        try:
+            response = self.session.post(GitHubConfig.GRAPHQL_URL, json=payload)
+            response.raise_for_status()
+            data = response.json().get("data")
+            if data is None:
+                raise requests.RequestException("Réponse GraphQL sans données")
+        except (requests.RequestException, ValueError) as e:
+            self.logger.warning("Échec de la requête GraphQL, repli sur l'API REST: %s", e)
+            self.use_graphql = False
+            return None
+        
+        details: List[Optional[Dict[str, Any]]] = []
+        missing: List[int] = []
+        for i in range(len(logins)):
+            user = data.get(f"u{i}")
+            if not user:
+                # Organizations and renamed accounts resolve to null
+                missing.append(i)
+            details.append({
+                "login": user["login"],
+                "id": user["databaseId"],
+                "created_at": user["createdAt"],
+                "avatar_url": user["avatarUrl"],
+                "bio": user["bio"] or None
+            } if user else None)
+        if missing:
+            self.logger.info(
+                "%d compte(s) non résolu(s) via GraphQL, récupération via l'API REST: %s",
+                len(missing), ", ".join(logins[i] for i in missing)
+            )
+            with ThreadPoolExecutor(max_workers=GitHubConfig.MAX_CONCURRENCY) as executor:
+                fallback = executor.map(self.get_single_user, [logins[i] for i in missing])
+                for i, user in zip(missing, fallback):
+                    details[i] = user
+        return details
+
     def get_single_user(self, login: str) -> Optional[Dict[str, Any]]:
         """Récupère les informations détaillées d'un utilisateur.
         
@@ -148,32 +241,56 @@ class GitHubUserExtractor:
             Données détaillées de l'utilisateur ou None si erreur
         """
         try:
-            response = requests.get(
-                f"{GitHubConfig.BASE_URL}/{login}",
-                headers=self.headers
-            )
+            response = self.session.get(f"{GitHubConfig.BASE_URL}/{login}")
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
-            self.logger.error(f"Erreur lors de la récupération de l'utilisateur {login}: {e}")
+            self.logger.error("Erreur lors de la récupération de l'utilisateur %s: %s", login, e)
             return None
 
-    def _handle_rate_limiting(self, response: requests.Response) -> None:
+    def _handle_rate_limiting(
+        self,
+        response: requests.Response,
+        pending_requests: int = 0,
+        elapsed: float = 0.0,
+        batch_cost: int = GitHubConfig.BATCH_SIZE + 1
+    ) -> None:
         """Gère les limites de taux de l'API GitHub.
         
+        Aucune pause n'est faite tant que le quota restant couvre les requêtes
+        à venir. Sinon, les lots sont espacés pour répartir le quota jusqu'à
+        sa réinitialisation, et l'on attend la réinitialisation si le quota
+        passe sous GitHubConfig.RATE_LIMIT_THRESHOLD.
+        
         Args:
             response: Réponse de l'API à analyser
+            pending_requests: Nombre de requêtes restant à effectuer
+            elapsed: Durée en secondes du lot qui vient d'être traité
+            batch_cost: Nombre de requêtes REST consommées par lot
         """
         remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
         reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+        wait_time = max(reset_time - datetime.now().timestamp(), 0)
         
-        if remaining < 10:
-            wait_time = max(reset_time - datetime.now().timestamp(), 0)
+        if remaining < GitHubConfig.RATE_LIMIT_THRESHOLD:
             print(f"Limite de taux proche, attente de {wait_time:.0f} secondes...")
             sleep(wait_time)
+            return
+        
+        if pending_requests <= remaining or wait_time == 0:
+            return
+        
+        batch_interval = batch_cost * wait_time / remaining
+        # Never wait past the reset: the quota is full again at that point
+        delay = min(batch_interval, wait_time) - elapsed
+        if delay > 0:
+            sleep(delay)
 
     def save_users(self, users: List[Dict[str, Any]], filepath: str) -> None:
-        """Sauvegarde les données utilisateurs dans un fichier JSON.
+        """Sauvegarde les données utilisateurs dans un fichier JSON Lines.
+        
+        Chaque utilisateur est écrit sur sa propre ligne, ce qui permet
+        de relire le fichier en flux.
         
         Args:
             users: Liste des utilisateurs à sauvegarder
@@ -181,11 +298,12 @@ class GitHubUserExtractor:
         """
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(users, f, indent=2, ensure_ascii=False)
+            for user in users:
+                f.write(json.dumps(user, ensure_ascii=False) + "\n")
         print(f"Données sauvegardées dans {filepath}")
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     extractor = GitHubUserExtractor()
     users = extractor.extract_users(max_users=GitHubConfig.DEFAULT_MAX_USERS)
-    extractor.save_users(users, "data/users.json")
\ No newline at end of file
+    extractor.save_users(users, "data/users.jsonl")
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+Cœur du filtrage des utilisateurs GitHub.
+
+Ce module regroupe la boucle de déduplication et de filtrage exécutée pour
+chaque enregistrement. Entièrement typé, il peut être compilé en extension
+C avec mypyc (``mypyc filter_core.py``) ; le module compilé est alors
+importé à la place de ce fichier, sans autre modification.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class FilterCore:
+    """Boucle de déduplication et de filtrage des utilisateurs.
+
+    Seul le premier enregistrement lu pour un ID est pris en compte ; les
+    suivants sont comptés comme doublons. Les utilisateurs acceptés sont
+    réduits aux champs conservés.
+
+    Les champs obligatoires (bio et avatar_url) sont testés directement,
+    sans parcourir de liste.
+
+    Attributes:
+        keep (Tuple[str, ...]): Champs conservés pour chaque utilisateur
+        min_date (str): Date minimale de création, au format YYYY-MM-DD
+        seen (Set[int]): IDs déjà rencontrés
+        total (int): Nombre d'enregistrements lus
+        duplicates (int): Nombre de doublons ignorés
+        filtered (int): Nombre d'utilisateurs acceptés
+    """
+
+    def __init__(self, keep: Tuple[str, ...], min_date: str) -> None:
+        """
+        Initialise la boucle avec les critères de filtrage.
+
+        Args:
+            keep: Champs conservés pour chaque utilisateur
+            min_date: Date minimale de création, au format YYYY-MM-DD
+        """
+        self.keep: Tuple[str, ...] = keep
+        self.min_date: str = min_date
+        self.seen: Set[int] = set()
+        self.total: int = 0
+        self.duplicates: int = 0
+        self.filtered: int = 0
+
+    def _accept(self, user: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Applique les critères de filtrage à un utilisateur.
+
+        Args:
+            user: Utilisateur décodé
+
+        Returns:
+            L'utilisateur réduit aux champs conservés, ou None s'il est rejeté
+        """
+        # Inlined FilterConfig.REQUIRED_FIELDS: update both if the list changes
+        if not (user.get('bio') and user.get('avatar_url')):
+            return None
+        # ISO dates (YYYY-MM-DD) compare lexicographically in chronological order
+        created_at: str = user['created_at']
+        if created_at[:10] < self.min_date:
+            return None
+        return {field: user[field] for field in self.keep if field in user}
+
+    def _unique(self, users: Iterable[Dict[str, Any]]) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+        """
+        Déduplique les utilisateurs et applique les critères de filtrage.
+
+        Args:
+            users: Utilisateurs décodés
+
+        Yields:
+            Pour chaque ID rencontré pour la première fois, le couple
+            (ID, utilisateur accepté ou None)
+        """
+        seen = self.seen
+        for user in users:
+            self.total += 1
+            user_id: int = user['id']
+            if user_id in seen:
+                self.duplicates += 1
+                continue
+            seen.add(user_id)
+            accepted = self._accept(user)
+            if accepted is not None:
+                self.filtered += 1
+            yield user_id, accepted
+
+    def stream(self, users: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Déduplique et filtre les utilisateurs au fil de la lecture.
+
+        Args:
+            users: Utilisateurs décodés
+
+        Yields:
+            Utilisateurs uniques respectant les critères
+        """
+        for _, accepted in self._unique(users):
+            if accepted is not None:
+                yield accepted
+
+    def entries(self, users: Iterable[Dict[str, Any]]) -> List[Tuple[int, Optional[Dict[str, Any]]]]:
+        """
+        Déduplique et filtre les utilisateurs en conservant les IDs rejetés.
+
+        Chaque ID rencontré pour la première fois est associé à l'utilisateur
+        accepté ou à None, afin que la déduplication puisse être poursuivie
+        entre plusieurs tranches.
+
+        Args:
+            users: Utilisateurs décodés
+
+        Returns:
+            Couples (ID, utilisateur ou None) dans l'ordre de lecture
+        """
+        return list(self._unique(users))
@@ -6,11 +6,31 @@ des utilisateurs GitHub, incluant la déduplication et le filtrage selon
 des critères spécifiques.
 """
 
-from typing import List, Dict, Any, ClassVar
-from datetime import datetime
+from typing import List, Dict, Any, ClassVar, Iterable, Iterator, Set, BinaryIO, Optional, Tuple
+import argparse
+import hashlib
 import json
 import logging
+import mmap
+import os
+import shutil
+import threading
+from functools import partial
+from multiprocessing.pool import Pool
 from pathlib import Path
+from queue import Queue
+
+from filter_core import FilterCore
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode()
 
 class FilterConfig:
     """Configuration des critères de filtrage.
@@ -20,12 +40,84 @@ class FilterConfig:
     
     Attributes:
         MIN_DATE (str): Date minimale de création de compte
-        DATE_FORMAT (str): Format pour l'analyse des dates
+        DATE_FORMAT (str): Format de MIN_DATE, comparée aux dates ISO par ordre lexicographique
         REQUIRED_FIELDS (List[str]): Champs obligatoires dans les données
+        OUTPUT_FORMATS (List[str]): Formats de sortie supportés
+        KEEP_FIELDS (List[str]): Champs conservés pour chaque utilisateur
+            (et colonnes écrites au format Parquet)
+        CACHE_KEY_SIZE (int): Taille en octets de la clé du cache de sortie
+        WRITE_BATCH_SIZE (int): Nombre d'utilisateurs transmis par lot au thread d'écriture
+        WRITE_QUEUE_SIZE (int): Nombre maximal de lots en attente d'écriture
     """
     MIN_DATE: ClassVar[str] = "2000-01-01"
     DATE_FORMAT: ClassVar[str] = "%Y-%m-%d"
     REQUIRED_FIELDS: ClassVar[List[str]] = ["bio", "avatar_url"]
+    OUTPUT_FORMATS: ClassVar[List[str]] = ["json", "parquet"]
+    KEEP_FIELDS: ClassVar[List[str]] = ["login", "id", "created_at", "avatar_url", "bio"]
+    CACHE_KEY_SIZE: ClassVar[int] = 8
+    WRITE_BATCH_SIZE: ClassVar[int] = 4096
+    WRITE_QUEUE_SIZE: ClassVar[int] = 8
+
+# ISO dates (YYYY-MM-DD) compare lexicographically in chronological order
+_MIN_DATE: str = FilterConfig.MIN_DATE
+assert len(_MIN_DATE) == 10, "FilterConfig.MIN_DATE must use the YYYY-MM-DD format"
+# FilterCore tests these fields inline rather than looping over the list
+assert FilterConfig.REQUIRED_FIELDS == ["bio", "avatar_url"], "Update FilterCore._accept with REQUIRED_FIELDS"
+
+def _new_core() -> FilterCore:
+    """
+    Crée la boucle de filtrage configurée selon FilterConfig.
+    
+    Returns:
+        Instance de FilterCore, compilée si filter_core l'a été avec mypyc
+    """
+    return FilterCore(tuple(FilterConfig.KEEP_FIELDS), _MIN_DATE)
+
+def _read_span(mm: mmap.mmap, end: int) -> Iterator[Dict[str, Any]]:
+    """
+    Décode les lignes d'un fichier projeté, de la position courante jusqu'à end.
+    
+    Args:
+        mm: Fichier source projeté en mémoire, positionné en début de ligne
+        end: Position (en octets) de fin de lecture
+        
+    Yields:
+        Dictionnaire de chaque utilisateur
+    """
+    while mm.tell() < end:
+        line = mm.readline()
+        if line.strip():
+            yield _loads(line)
+
+def _process_shard(
+    path: Path,
+    span: Tuple[int, int]
+) -> Tuple[List[Tuple[int, Optional[Dict[str, Any]]]], int, int]:
+    """
+    Déduplique et filtre une tranche du fichier JSON Lines source.
+    
+    Cette fonction s'exécute dans un processus de travail. Pour chaque ID
+    rencontré pour la première fois dans la tranche, elle renvoie
+    l'utilisateur réduit aux champs FilterConfig.KEEP_FIELDS s'il respecte
+    les critères, ou None sinon, afin que le processus principal puisse
+    appliquer la déduplication entre tranches.
+    
+    Args:
+        path: Chemin du fichier source
+        span: Positions de début et de fin (en octets) de la tranche,
+            alignées sur des débuts de ligne
+        
+    Returns:
+        Tuple contenant les couples (ID, utilisateur ou None) dans l'ordre
+        du fichier, le nombre d'enregistrements lus et le nombre de
+        doublons internes à la tranche
+    """
+    start, end = span
+    core = _new_core()
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        mm.seek(start)
+        entries = core.entries(_read_span(mm, end))
+    return entries, core.total, core.duplicates
 
 class UserFilter:
     """Gestionnaire de filtrage des données utilisateurs.
@@ -35,22 +127,31 @@ class UserFilter:
     des critères spécifiques.
     
     Attributes:
-        input_file (Path): Chemin vers le fichier JSON source
+        input_file (Path): Chemin vers le fichier JSON Lines source
         output_file (Path): Chemin pour sauvegarder les données filtrées
+        output_format (str): Format de sortie (json ou parquet)
         stats (Dict[str, int]): Statistiques du processus de filtrage
         logger (logging.Logger): Instance de logger pour la classe
     """
     
-    def __init__(self, input_file: str, output_file: str) -> None:
+    def __init__(self, input_file: str, output_file: str, output_format: str = "json") -> None:
         """
         Initialise le filtre avec les chemins des fichiers.
         
         Args:
-            input_file: Chemin du fichier JSON source
+            input_file: Chemin du fichier JSON Lines source
             output_file: Chemin du fichier de destination
+            output_format: Format de sortie, parmi FilterConfig.OUTPUT_FORMATS
+            
+        Raises:
+            ValueError: Si le format de sortie n'est pas supporté
         """
+        if output_format not in FilterConfig.OUTPUT_FORMATS:
+            raise ValueError(f"Format de sortie non supporté: {output_format}")
         self.input_file: Path = Path(input_file)
         self.output_file: Path = Path(output_file)
+        self._tmp_file: Path = self.output_file.with_name(self.output_file.name + ".tmp")
+        self.output_format: str = output_format
         self.stats: Dict[str, int] = {
             "total": 0,
             "duplicates": 0,
@@ -58,108 +159,462 @@ class UserFilter:
         }
         self.logger: logging.Logger = logging.getLogger(__name__)
 
-    def load_users(self) -> List[Dict[str, Any]]:
+    def load_users(self) -> Iterator[Dict[str, Any]]:
         """
-        Charge les utilisateurs depuis le fichier JSON.
+        Lit les utilisateurs en flux depuis le fichier JSON Lines (un utilisateur par ligne).
+        
+        Le fichier est ouvert immédiatement, afin qu'un fichier absent soit
+        signalé avant toute écriture ; les utilisateurs sont ensuite produits
+        au fil de la lecture, sans charger l'ensemble du fichier en mémoire.
         
         Returns:
-            Liste des dictionnaires d'utilisateurs
+            Itérateur sur les dictionnaires d'utilisateurs
             
         Raises:
             FileNotFoundError: Si le fichier source n'existe pas
-            json.JSONDecodeError: Si le JSON est invalide
+            json.JSONDecodeError: Si le JSON est invalide (pendant l'itération)
         """
         try:
-            with open(self.input_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            self.logger.error(f"Error loading users: {e}")
+            f = open(self.input_file, 'rb')
+        except FileNotFoundError as e:
+            self.logger.error("Error loading users: %s", e)
             raise
+        return self._read_users(f)
+
+    def _read_users(self, f: BinaryIO) -> Iterator[Dict[str, Any]]:
+        """
+        Décode les lignes d'un fichier JSON Lines déjà ouvert, puis le ferme.
+        
+        Le fichier est projeté en mémoire (mmap) et lu directement depuis le
+        cache de pages du système, sans copie intermédiaire dans un tampon.
+        
+        Args:
+            f: Fichier source ouvert en mode binaire
+            
+        Yields:
+            Dictionnaire de chaque utilisateur
+        """
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for line in iter(mm.readline, b""):
+                        if line.strip():
+                            yield _loads(line)
+            except json.JSONDecodeError as e:
+                self.logger.error("Error loading users: %s", e)
+                raise
+
+    def _process_stream(self, users: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Déduplique et filtre les utilisateurs en un seul passage.
+        
+        Seul le premier enregistrement lu pour un ID est pris en compte ;
+        les suivants sont ignorés comme doublons. Chaque utilisateur accepté
+        est réduit aux champs FilterConfig.KEEP_FIELDS et produit
+        immédiatement, ce qui permet de l'écrire pendant la lecture. Les
+        statistiques sont à jour une fois l'itérateur épuisé.
+        
+        Args:
+            users: Utilisateurs à traiter
+            
+        Yields:
+            Utilisateurs uniques respectant les critères
+        """
+        core = _new_core()
+        yield from core.stream(users)
+        self.stats.update(total=core.total, duplicates=core.duplicates, filtered=core.filtered)
 
-    def remove_duplicates(self, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _shard_spans(self, workers: int) -> List[Tuple[int, int]]:
         """
-        Supprime les utilisateurs en double basé sur leur ID.
+        Découpe le fichier source en tranches alignées sur les fins de ligne.
         
         Args:
-            users: Liste des utilisateurs à dédupliquer
+            workers: Nombre de tranches souhaitées
             
         Returns:
-            Liste des utilisateurs sans doublons
+            Liste des positions (début, fin) en octets de chaque tranche non vide
         """
-        unique_users: Dict[int, Dict[str, Any]] = {}
-        for user in users:
-            unique_users[user['id']] = user
+        size = os.path.getsize(self.input_file)
+        if size == 0:
+            return []
         
-        self.stats["duplicates"] = len(users) - len(unique_users)
-        return list(unique_users.values())
+        bounds = [0]
+        with open(self.input_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for i in range(1, workers):
+                newline = mm.find(b"\n", max(size * i // workers, bounds[-1]))
+                bounds.append(size if newline == -1 else newline + 1)
+        bounds.append(size)
+        return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
 
-    def filter_users(self, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _process_parallel(self, workers: int, pool: Pool) -> Iterator[Dict[str, Any]]:
         """
-        Applique les critères de filtrage aux utilisateurs.
+        Déduplique et filtre les utilisateurs en parallèle, par tranches.
+        
+        Le fichier source est découpé immédiatement, afin qu'un fichier
+        absent soit signalé avant toute écriture. Chaque tranche est ensuite
+        traitée par un processus de travail.
         
         Args:
-            users: Liste des utilisateurs à filtrer
+            workers: Nombre de tranches
+            pool: Processus de travail, créés avant le thread d'écriture
             
         Returns:
-            Liste des utilisateurs filtrés selon les critères
+            Itérateur sur les utilisateurs uniques respectant les critères
+            
+        Raises:
+            FileNotFoundError: Si le fichier source n'existe pas
         """
-        min_date = datetime.strptime(FilterConfig.MIN_DATE, FilterConfig.DATE_FORMAT)
-        filtered: List[Dict[str, Any]] = []
+        try:
+            spans = self._shard_spans(workers)
+        except FileNotFoundError as e:
+            self.logger.error("Error loading users: %s", e)
+            raise
+        return self._merge_shards(spans, pool)
+
+    def _merge_shards(self, spans: List[Tuple[int, int]], pool: Pool) -> Iterator[Dict[str, Any]]:
+        """
+        Fusionne les résultats des tranches dans l'ordre du fichier.
         
-        for user in users:
-            if (all(user.get(field) for field in FilterConfig.REQUIRED_FIELDS) and 
-                datetime.strptime(user['created_at'][:10], FilterConfig.DATE_FORMAT) >= min_date):
-                filtered.append(user)
+        Le premier enregistrement lu pour un ID l'emporte, comme dans
+        _process_stream. Les statistiques sont à jour une fois l'itérateur
+        épuisé.
+        
+        Args:
+            spans: Positions (début, fin) en octets de chaque tranche
+            pool: Processus de travail
+            
+        Yields:
+            Utilisateurs uniques respectant les critères
+        """
+        seen: Set[int] = set()
+        total = 0
+        duplicates = 0
+        filtered = 0
+        
+        for entries, shard_total, shard_duplicates in pool.imap(partial(_process_shard, self.input_file), spans):
+            total += shard_total
+            duplicates += shard_duplicates
+            for user_id, user in entries:
+                if user_id in seen:
+                    duplicates += 1
+                    continue
+                seen.add(user_id)
+                if user is not None:
+                    filtered += 1
+                    yield user
         
-        self.stats["filtered"] = len(filtered)
-        return filtered
+        self.stats.update(total=total, duplicates=duplicates, filtered=filtered)
 
-    def process(self) -> None:
+    def _cache_path(self) -> Path:
         """
-        Exécute la chaîne complète de traitement des données.
+        Calcule le chemin du cache de sortie associé à l'état du fichier source.
         
-        Cette méthode orchestre le processus complet de filtrage:
-        1. Chargement des utilisateurs
-        2. Suppression des doublons
-        3. Application des filtres
-        4. Sauvegarde des résultats
-        5. Affichage des statistiques
+        La clé dérive de la taille et de la date de modification du fichier
+        source ainsi que des critères de filtrage et du format de sortie :
+        toute modification de l'un d'eux produit un nouveau chemin.
         
+        Returns:
+            Chemin du cache, à côté du fichier de destination
+            
         Raises:
-            FileNotFoundError: Si les fichiers sont inaccessibles
-            json.JSONDecodeError: Si le traitement JSON échoue
+            FileNotFoundError: Si le fichier source n'existe pas
+        """
+        st = os.stat(self.input_file)
+        fingerprint = (
+            f"{st.st_size}:{st.st_mtime_ns}:{FilterConfig.MIN_DATE}:"
+            f"{FilterConfig.REQUIRED_FIELDS}:{FilterConfig.KEEP_FIELDS}:{self.output_format}"
+        )
+        key = hashlib.blake2b(fingerprint.encode(), digest_size=FilterConfig.CACHE_KEY_SIZE).hexdigest()
+        return self.output_file.with_name(f"{self.output_file.stem}.{key}{self.output_file.suffix}")
+
+    def _copy_output(self, src: Path, dst: Path) -> None:
         """
-        # Load
-        users = self.load_users()
-        self.stats["total"] = len(users)
-        self.logger.info(f"Loaded {len(users)} users")
+        Copie un fichier de sortie via un fichier temporaire renommé à la fin.
         
-        # Process
-        users = self.remove_duplicates(users)
-        users = self.filter_users(users)
+        Args:
+            src: Fichier à copier
+            dst: Fichier de destination
+            
+        Raises:
+            IOError: Si la copie échoue
+        """
+        tmp = dst.with_name(dst.name + ".tmp")
+        try:
+            shutil.copyfile(src, tmp)
+            os.replace(tmp, dst)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    @staticmethod
+    def _stats_path(cache_path: Path) -> Path:
+        """
+        Calcule le chemin des statistiques enregistrées avec un cache.
         
-        # Save
+        Args:
+            cache_path: Chemin du cache calculé par _cache_path
+            
+        Returns:
+            Chemin du fichier JSON des statistiques, à côté du cache
+        """
+        return cache_path.with_name(cache_path.name + ".stats")
+
+    def _load_cache(self, cache_path: Path) -> bool:
+        """
+        Restaure la sortie et les statistiques d'une exécution précédente.
+        
+        Args:
+            cache_path: Chemin du cache calculé par _cache_path
+            
+        Returns:
+            True si le cache a été réutilisé, False s'il est absent ou incomplet
+        """
+        try:
+            stats = json.loads(self._stats_path(cache_path).read_bytes())
+        except (IOError, ValueError):
+            return False
+        if not cache_path.exists() or set(stats) != set(self.stats):
+            return False
+        self._copy_output(cache_path, self.output_file)
+        self.stats.update(stats)
+        return True
+
+    def _store_cache(self, cache_path: Path) -> None:
+        """
+        Enregistre la sortie produite et ses statistiques dans le cache,
+        puis supprime les anciens caches.
+        
+        Un échec est seulement journalisé : la sortie elle-même est déjà écrite.
+        
+        Args:
+            cache_path: Chemin du cache calculé par _cache_path
+        """
         try:
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(users, f, indent=2)
+            self._copy_output(self.output_file, cache_path)
+            self._stats_path(cache_path).write_text(json.dumps(self.stats))
+            stem, suffix = self.output_file.stem, self.output_file.suffix
+            pattern = f"{stem}.{'?' * (2 * FilterConfig.CACHE_KEY_SIZE)}{suffix}"
+            for stale in self.output_file.parent.glob(pattern):
+                if stale != cache_path:
+                    stale.unlink()
+                    stale_stats = self._stats_path(stale)
+                    if stale_stats.exists():
+                        stale_stats.unlink()
         except IOError as e:
-            self.logger.error(f"Error saving filtered users: {e}")
+            self.logger.warning("Error caching filtered users: %s", e)
+
+    def _save_users(self, users: Iterable[Dict[str, Any]]) -> None:
+        """
+        Écrit les utilisateurs dans le fichier de destination au fil de l'eau.
+        
+        Chaque utilisateur est sérialisé et écrit dès qu'il est produit.
+        L'écriture se fait dans un fichier temporaire renommé à la fin, pour
+        ne jamais laisser un fichier de sortie partiel.
+        
+        Args:
+            users: Utilisateurs à sauvegarder
+            
+        Raises:
+            IOError: Si le fichier de destination ne peut pas être écrit
+        """
+        try:
+            with open(self._tmp_file, 'wb') as f:
+                if self.output_format == "parquet":
+                    self._write_parquet(users, f)
+                else:
+                    self._write_jsonl(users, f)
+            os.replace(self._tmp_file, self.output_file)
+        except IOError as e:
+            self.logger.error("Error saving filtered users: %s", e)
             raise
+        finally:
+            if self._tmp_file.exists():
+                self._tmp_file.unlink()
+
+    def _write_jsonl(self, users: Iterable[Dict[str, Any]], f: BinaryIO) -> None:
+        """
+        Écrit les utilisateurs au format JSON Lines depuis un thread dédié.
+        
+        Les utilisateurs produits par le filtrage sont regroupés par lots de
+        FilterConfig.WRITE_BATCH_SIZE et transmis au thread d'écriture par
+        une file bornée : la sérialisation et les écritures sur disque se
+        déroulent pendant que la lecture et le filtrage continuent. Le
+        filtrage s'arrête au premier lot qui suit une erreur d'écriture.
+        
+        Args:
+            users: Utilisateurs à sauvegarder
+            f: Fichier de destination ouvert en mode binaire
             
-        # Print stats
-        print(f"\nUtilisateurs chargés : {self.stats['total']}")
-        print(f"Doublons supprimés : {self.stats['duplicates']}")
-        print(f"Utilisateurs filtrés : {self.stats['filtered']}")
+        Raises:
+            IOError: Si l'écriture échoue dans le thread d'écriture
+        """
+        queue: "Queue[Optional[List[Dict[str, Any]]]]" = Queue(maxsize=FilterConfig.WRITE_QUEUE_SIZE)
+        errors: List[BaseException] = []
+        writer = threading.Thread(target=self._writer, args=(queue, f, errors), daemon=True)
+        writer.start()
+        batch_size = FilterConfig.WRITE_BATCH_SIZE
+        try:
+            batch: List[Dict[str, Any]] = []
+            append = batch.append
+            for user in users:
+                append(user)
+                if len(batch) >= batch_size:
+                    if errors:
+                        break
+                    queue.put(batch)
+                    batch = []
+                    append = batch.append
+            else:
+                # Flush the tail batch unless a write error stopped the loop
+                if batch:
+                    queue.put(batch)
+        finally:
+            # None marks the end of the stream, also when filtering fails
+            queue.put(None)
+            writer.join()
+        if errors:
+            raise errors[0]
+
+    @staticmethod
+    def _writer(
+        queue: "Queue[Optional[List[Dict[str, Any]]]]",
+        f: BinaryIO,
+        errors: List[BaseException]
+    ) -> None:
+        """
+        Sérialise et écrit les lots reçus jusqu'à la fin du flux.
+        
+        Chaque lot est sérialisé en un seul bloc, écrit par un unique appel
+        à write.
+        
+        En cas d'erreur, la file continue d'être vidée sans écrire, afin que
+        le thread de filtrage ne reste jamais bloqué ; l'erreur est transmise
+        par la liste errors.
+        
+        Args:
+            queue: File des lots d'utilisateurs à écrire, terminée par None
+            f: Fichier de destination ouvert en mode binaire
+            errors: Liste recevant l'éventuelle erreur d'écriture
+        """
+        write = f.write
+        while True:
+            batch = queue.get()
+            if batch is None:
+                return
+            if errors:
+                continue
+            try:
+                write(b"\n".join(map(_dumps, batch)) + b"\n")
+            except Exception as e:
+                errors.append(e)
+
+    def _write_parquet(self, users: Iterable[Dict[str, Any]], f: BinaryIO) -> None:
+        """
+        Écrit les utilisateurs au format Parquet.
+        
+        Les utilisateurs sont d'abord rangés par colonne (FilterConfig.KEEP_FIELDS),
+        puis la table est écrite en un seul appel à pyarrow.
+        
+        Args:
+            users: Utilisateurs à sauvegarder
+            f: Fichier de destination ouvert en mode binaire
+            
+        Raises:
+            ImportError: Si pyarrow n'est pas installé
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Le format parquet nécessite pyarrow (pip install pyarrow)") from e
+        
+        columns: Dict[str, List[Any]] = {field: [] for field in FilterConfig.KEEP_FIELDS}
+        appenders = [(field, columns[field].append) for field in FilterConfig.KEEP_FIELDS]
+        for user in users:
+            for field, append in appenders:
+                append(user.get(field))
+        pq.write_table(pa.Table.from_pydict(columns), f)
+
+    def process(self, workers: int = 1, use_cache: bool = True) -> None:
+        """
+        Exécute la chaîne complète de traitement des données.
+        
+        Cette méthode orchestre le processus complet de filtrage:
+        1. Réutilisation de la sortie en cache si le fichier source n'a pas
+           changé (les statistiques de l'exécution d'origine sont restaurées)
+        2. Sinon, chargement, suppression des doublons, filtrage et sauvegarde
+           en flux, puis mise en cache de la sortie et des statistiques
+        3. Journalisation des statistiques
+        
+        Args:
+            workers: Nombre de processus utilisés pour le décodage et le
+                filtrage (1 pour un traitement dans le processus courant)
+            use_cache: Réutilise et alimente le cache de sortie
+        
+        Raises:
+            FileNotFoundError: Si les fichiers sont inaccessibles
+            json.JSONDecodeError: Si le traitement JSON échoue
+        """
+        # Short-circuit when the input and criteria match a previous run
+        cache_path = None
+        if use_cache:
+            try:
+                cache_path = self._cache_path()
+            except FileNotFoundError as e:
+                self.logger.error("Error loading users: %s", e)
+                raise
+        reused = cache_path is not None and self._load_cache(cache_path)
+        if reused:
+            self.logger.info("Input unchanged, reused cached output %s", cache_path)
+        else:
+            # Load, deduplicate, filter and save in a single streaming pass
+            if workers > 1:
+                # Fork the workers before _save_users starts the writer thread
+                with Pool(workers) as pool:
+                    self._save_users(self._process_parallel(workers, pool))
+            else:
+                self._save_users(self._process_stream(self.load_users()))
+            if cache_path is not None:
+                self._store_cache(cache_path)
+        
+        # Report stats
+        self.logger.info(
+            "Loaded %d users, removed %d duplicates, kept %d filtered users",
+            self.stats["total"], self.stats["duplicates"], self.stats["filtered"]
+        )
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Filtrage des utilisateurs GitHub extraits")
+    parser.add_argument(
+        "--format",
+        choices=FilterConfig.OUTPUT_FORMATS,
+        default="json",
+        help="Format de sortie (json par défaut, parquet nécessite pyarrow)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Nombre de processus pour le filtrage des gros fichiers (1 par défaut)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Refait le filtrage même si le fichier source n'a pas changé"
+    )
+    args = parser.parse_args()
+    
     # Configuration des chemins de fichiers
-    input_file = "data/users.json"
-    output_file = "data/filtered_users.json"
+    input_file = "data/users.jsonl"
+    output_file = "data/filtered_users.parquet" if args.format == "parquet" else "data/filtered_users.jsonl"
     
     try:
         # Création et exécution du filtre
-        filter = UserFilter(input_file, output_file)
-        filter.process()
+        filter = UserFilter(input_file, output_file, args.format)
+        filter.process(workers=args.workers, use_cache=not args.no_cache)
         print("Filtrage terminé avec succès!")
     except Exception as e:
         print(f"Une erreur est survenue: {e}")
\ No newline at end of file